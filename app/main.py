@@ -1,150 +1,190 @@
 #!/usr/bin/env python3
 import sys
 import os
-import time
-from modules.constants import GITGURU_BANNER, HEADING_COLOR, CONTENT_COLOR, RESET_COLOR, VERSION
-from modules.ui import display_commands
-from modules.branch_ops import (
-    init_git_repo, create_new_branch, merge_branches, commit_changes,
-    push_branch, switch_branch, delete_branches
-)
-from modules.git_utils import run_git_command
-from modules.tree import display_tree
+from modules.constants import GITGURU_BANNER, BANNER_BYTES, HEADING_COLOR, CONTENT_COLOR, RESET_COLOR, VERSION
 
 
-def main():
-    # Print ASCII art banner
-    for line in GITGURU_BANNER.splitlines():
-        print(f"{HEADING_COLOR}{line}{RESET_COLOR}")
-        sys.stdout.flush()
-        time.sleep(0.05)
-    print(f"{HEADING_COLOR}Version: {VERSION}{RESET_COLOR}")
-
-    # Handle help and init commands
-    script_path = os.path.realpath(sys.argv[0])
-    if len(sys.argv) > 1 and sys.argv[1] == "help":
-        git_dir = "."
-        if os.path.isdir(os.path.join(git_dir, ".git")):
-            display_tree(git_dir, "Before Help")
-        display_commands(script_path)
-        sys.exit(0)
-    elif len(sys.argv) > 1 and sys.argv[1] == "init":
-        git_dir = sys.argv[2] if len(sys.argv) > 2 else "."
-        if len(sys.argv) > 3:
-            print(f"{HEADING_COLOR}Error: 'init' accepts only an optional [git_dir].{RESET_COLOR}")
-            sys.exit(1)
-        init_git_repo(git_dir)
-        sys.exit(0)
-
-    # Set default git directory and command
-    git_dir = "."
-    command = "view" if len(sys.argv) == 1 else sys.argv[1]
-    args = sys.argv[1:] if len(sys.argv) == 1 else sys.argv[2:]
-
-    # Handle view command with optional directory
-    if command == "view":
-        if args and len(args) > 1:
-            print(f"{HEADING_COLOR}Error: Invalid arguments for 'view'. Specify [git_dir] only.{RESET_COLOR}")
-            sys.exit(1)
-        if args:
-            git_dir = args[0]
-        if not os.path.isdir(os.path.join(git_dir, ".git")):
-            print(f"{HEADING_COLOR}Error: '{git_dir}' is not a Git repository. Use 'init' to initialize one.{RESET_COLOR}")
-            sys.exit(1)
-        display_tree(git_dir)
-        sys.exit(0)
-
-    # Check if it's a Git repository for all other commands
+def _require_repo(git_dir):
+    """Exit with an error unless git_dir contains a Git repository."""
     if not os.path.isdir(os.path.join(git_dir, ".git")):
         print(f"{HEADING_COLOR}Error: '{git_dir}' is not a Git repository. Use 'init' to initialize one.{RESET_COLOR}")
         sys.exit(1)
 
-    # Handle remaining commands
-    if command == "branch":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) < 5 or len(sys.argv) > 6:
-            print(f"{HEADING_COLOR}Error: 'branch' requires version, owner, type, and optional description.{RESET_COLOR}")
-            sys.exit(1)
-        version, owner, branch_type = sys.argv[2:5]
-        description = sys.argv[5] if len(sys.argv) == 6 else None
-        create_new_branch(version, owner, branch_type, description)
-
-    elif command == "merge":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) != 4:
-            print(f"{HEADING_COLOR}Error: 'merge' requires source and target branches.{RESET_COLOR}")
-            sys.exit(1)
-        source, target = sys.argv[2:4]
-        merge_branches(source, target)
-
-    elif command == "commit":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) < 3:
-            print(f"{HEADING_COLOR}Error: 'commit' requires a message.{RESET_COLOR}")
-            sys.exit(1)
-        message = " ".join(sys.argv[2:])
-        commit_changes(message)
-
-    elif command == "push":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) != 2:
-            print(f"{HEADING_COLOR}Error: 'push' takes no arguments.{RESET_COLOR}")
-            sys.exit(1)
-        push_branch()
-
-    elif command == "switch":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) != 3:
-            print(f"{HEADING_COLOR}Error: 'switch' requires a branch name.{RESET_COLOR}")
-            sys.exit(1)
-        branch = sys.argv[2]
-        switch_branch(branch)
-
-    elif command == "delete":
-        display_tree(git_dir, "Before Command")
-        if len(sys.argv) < 3:
-            print(f"{HEADING_COLOR}Error: 'delete' requires at least one branch name.{RESET_COLOR}")
-            sys.exit(1)
-        args = sys.argv[2:]
-        force = "--force" in args
-        branches_to_delete = [arg for arg in args if arg != "--force"]
-        if not branches_to_delete:
-            print(f"{HEADING_COLOR}Error: No branches specified to delete.{RESET_COLOR}")
-            sys.exit(1)
-        delete_branches(branches_to_delete, force)
-
-    elif command == "cto-hotfix":
-        display_tree(git_dir, "Before CTO Hotfix")
-        if len(sys.argv) != 3:
-            print(f"{HEADING_COLOR}Error: 'cto-hotfix' requires version only (e.g., 'cto-hotfix 0.0.2').{RESET_COLOR}")
-            sys.exit(1)
-        version = sys.argv[2]
-        # Switch to main first, then create the hotfix branch without description
-        switch_branch("main")
-        create_new_branch(version, "cto", "hotfix", None)
-
-    elif command == "cto-hotfix-push":
-        display_tree(git_dir, "Before CTO Hotfix Push")
-        if len(sys.argv) != 3:
-            print(f"{HEADING_COLOR}Error: 'cto-hotfix-push' requires the hotfix version (e.g., 'cto-hotfix-push 0.0.2').{RESET_COLOR}")
-            sys.exit(1)
-        version = sys.argv[2]
-        hotfix_branch = f"{version}/cto/hotfix"
-        # Check if the branch exists
-        branches = run_git_command(["git", "branch"], "Failed to list branches").strip().splitlines()
-        if not any(b.strip().strip('* ') == hotfix_branch for b in branches):
-            print(f"{HEADING_COLOR}Error: Hotfix branch '{hotfix_branch}' does not exist. Create it first with 'cto-hotfix'.{RESET_COLOR}")
-            sys.exit(1)
-        # Switch to main, merge the hotfix, and push
-        switch_branch("main")
-        merge_branches(hotfix_branch, "main")
-        push_branch()
-        # Optionally delete the hotfix branch after merging
-        delete_branches([hotfix_branch], force=False)
 
-    else:
-        print(f"{HEADING_COLOR}Error: Unknown command '{command}'. Try 'help' for available commands.{RESET_COLOR}")
+def _cmd_help(args, git_dir):
+    from modules.ui import display_commands
+    if os.path.isdir(os.path.join(git_dir, ".git")):
+        from modules.tree import display_tree
+        display_tree(git_dir, "Before Help")
+    display_commands(os.path.realpath(sys.argv[0]))
+
+
+def _cmd_init(args, git_dir):
+    if len(args) > 1:
+        print(f"{HEADING_COLOR}Error: 'init' accepts only an optional [git_dir].{RESET_COLOR}")
+        sys.exit(1)
+    from modules.branch_ops import init_git_repo
+    init_git_repo(args[0] if args else git_dir)
+
+
+def _cmd_view(args, git_dir):
+    if len(args) > 1:
+        print(f"{HEADING_COLOR}Error: Invalid arguments for 'view'. Specify [git_dir] only.{RESET_COLOR}")
+        sys.exit(1)
+    if args:
+        git_dir = args[0]
+    _require_repo(git_dir)
+    from modules.tree import display_tree
+    display_tree(git_dir)
+
+
+def _cmd_branch(args, git_dir):
+    _require_repo(git_dir)
+    if not 3 <= len(args) <= 4:
+        print(f"{HEADING_COLOR}Error: 'branch' requires version, owner, type, and optional description.{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import create_new_branch
+    display_tree(git_dir, "Before Command")
+    version, owner, branch_type = args[:3]
+    description = args[3] if len(args) == 4 else None
+    create_new_branch(version, owner, branch_type, description)
+
+
+def _cmd_merge(args, git_dir):
+    _require_repo(git_dir)
+    if len(args) != 2:
+        print(f"{HEADING_COLOR}Error: 'merge' requires source and target branches.{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import merge_branches
+    display_tree(git_dir, "Before Command")
+    source, target = args
+    merge_branches(source, target)
+
+
+def _cmd_commit(args, git_dir):
+    _require_repo(git_dir)
+    if not args:
+        print(f"{HEADING_COLOR}Error: 'commit' requires a message.{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import commit_changes
+    display_tree(git_dir, "Before Command")
+    commit_changes(" ".join(args))
+
+
+def _cmd_push(args, git_dir):
+    _require_repo(git_dir)
+    if args:
+        print(f"{HEADING_COLOR}Error: 'push' takes no arguments.{RESET_COLOR}")
         sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import push_branch
+    display_tree(git_dir, "Before Command")
+    push_branch()
+
+
+def _cmd_switch(args, git_dir):
+    _require_repo(git_dir)
+    if len(args) != 1:
+        print(f"{HEADING_COLOR}Error: 'switch' requires a branch name.{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import switch_branch
+    display_tree(git_dir, "Before Command")
+    switch_branch(args[0])
+
+
+def _cmd_delete(args, git_dir):
+    _require_repo(git_dir)
+    if not args:
+        print(f"{HEADING_COLOR}Error: 'delete' requires at least one branch name.{RESET_COLOR}")
+        sys.exit(1)
+    force = "--force" in args
+    branches_to_delete = [arg for arg in args if arg != "--force"]
+    if not branches_to_delete:
+        print(f"{HEADING_COLOR}Error: No branches specified to delete.{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import delete_branches
+    display_tree(git_dir, "Before Command")
+    delete_branches(branches_to_delete, force)
+
+
+def _cmd_cto_hotfix(args, git_dir):
+    _require_repo(git_dir)
+    if len(args) != 1:
+        print(f"{HEADING_COLOR}Error: 'cto-hotfix' requires version only (e.g., 'cto-hotfix 0.0.2').{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import switch_branch, create_new_branch
+    display_tree(git_dir, "Before CTO Hotfix")
+    # Switch to main first, then create the hotfix branch without description
+    switch_branch("main")
+    create_new_branch(args[0], "cto", "hotfix", None)
+
+
+def _cmd_cto_hotfix_push(args, git_dir):
+    _require_repo(git_dir)
+    if len(args) != 1:
+        print(f"{HEADING_COLOR}Error: 'cto-hotfix-push' requires the hotfix version (e.g., 'cto-hotfix-push 0.0.2').{RESET_COLOR}")
+        sys.exit(1)
+    from modules.tree import display_tree
+    from modules.branch_ops import switch_branch, merge_branches, push_branch, delete_branches
+    from modules.git_utils import get_local_branches
+    display_tree(git_dir, "Before CTO Hotfix Push")
+    hotfix_branch = f"{args[0]}/cto/hotfix"
+    # Check if the branch exists
+    existing = frozenset(get_local_branches(git_dir))
+    if hotfix_branch not in existing:
+        print(f"{HEADING_COLOR}Error: Hotfix branch '{hotfix_branch}' does not exist. Create it first with 'cto-hotfix'.{RESET_COLOR}")
+        sys.exit(1)
+    # Switch to main, merge the hotfix, and push
+    switch_branch("main")
+    merge_branches(hotfix_branch, "main")
+    push_branch()
+    # Optionally delete the hotfix branch after merging
+    delete_branches([hotfix_branch], force=False)
+
+
+def _cmd_unknown(args, git_dir):
+    print(f"{HEADING_COLOR}Error: Unknown command '{sys.argv[1]}'. Try 'help' for available commands.{RESET_COLOR}")
+    sys.exit(1)
+
+
+# Each handler validates its own arguments and imports only the operations it needs
+COMMANDS = {
+    "help": _cmd_help,
+    "init": _cmd_init,
+    "view": _cmd_view,
+    "branch": _cmd_branch,
+    "merge": _cmd_merge,
+    "commit": _cmd_commit,
+    "push": _cmd_push,
+    "switch": _cmd_switch,
+    "delete": _cmd_delete,
+    "cto-hotfix": _cmd_cto_hotfix,
+    "cto-hotfix-push": _cmd_cto_hotfix_push,
+}
+
+
+def main():
+    # Print ASCII art banner, animated line by line only when GITGURU_ANIMATE is set
+    if os.environ.get("GITGURU_ANIMATE"):
+        import time
+        for line in GITGURU_BANNER.splitlines():
+            print(f"{HEADING_COLOR}{line}{RESET_COLOR}")
+            sys.stdout.flush()
+            time.sleep(0.05)
+        print(f"{HEADING_COLOR}Version: {VERSION}{RESET_COLOR}")
+    else:
+        sys.stdout.buffer.write(BANNER_BYTES)
+
+    # With no arguments, show the tree of the current directory
+    command = sys.argv[1] if len(sys.argv) > 1 else "view"
+    handler = COMMANDS.get(command, _cmd_unknown)
+    handler(sys.argv[2:], ".")
 
 
 if __name__ == "__main__":
@@ -1,45 +1,41 @@
 import os
-import re
 import sys
-import threading
 import subprocess
-from .constants import HEADING_COLOR, CONTENT_COLOR, RESET_COLOR, VALID_TYPES, BRANCH_PATTERN
-from .git_utils import run_git_command
-from .ui import animate_loading
+from .constants import (
+    HEADING_COLOR, CONTENT_COLOR, RESET_COLOR, VALID_TYPES, BRANCH_PATTERN,
+    VERSION_RE, OWNER_RE, DESC_RE
+)
+from .git_utils import run_git_command, get_local_branches
+from .ui import loading_label, stop_loading
 from .tree import display_tree
 
 
 def validate_branch_name(branch):
     """Check if branch name follows the convention."""
+    if branch == "main":
+        return
     if not BRANCH_PATTERN.match(branch):
+        stop_loading(failed=True)
         print(f"{HEADING_COLOR}Error: Invalid branch name '{branch}'. Must be 'main' or follow <version>/<owner>/<type>[/<description>] (e.g., 0.0.1/tom/feature/test).{RESET_COLOR}")
         sys.exit(1)
 
 
 def init_git_repo(git_dir="."):
     """Initialize a new Git repository with an initial commit on main, staging all existing files."""
-    os.chdir(git_dir)
-
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Initializing Git repository in {git_dir}"))
-    animation_thread.start()
-
-    if os.path.isdir(".git"):
-        stop_event.set()
-        animation_thread.join()
-        print(f"{HEADING_COLOR}Error: Directory '{git_dir}' is already a Git repository.{RESET_COLOR}")
-        sys.exit(1)
+    with loading_label(f"Initializing Git repository in {git_dir}"):
+        if os.path.isdir(os.path.join(git_dir, ".git")):
+            stop_loading(failed=True)
+            print(f"{HEADING_COLOR}Error: Directory '{git_dir}' is already a Git repository.{RESET_COLOR}")
+            sys.exit(1)
 
-    run_git_command(["git", "init"], "Failed to initialize Git repository")
-    run_git_command(["git", "add", "."], "Failed to stage existing files")
-    run_git_command(["git", "commit", "-m", "Initial commit with existing files"], "Failed to create initial commit")
+        run_git_command(["git", "init"], "Failed to initialize Git repository", cwd=git_dir)
+        run_git_command(["git", "add", "."], "Failed to stage existing files", cwd=git_dir)
+        run_git_command(["git", "commit", "-m", "Initial commit with existing files"], "Failed to create initial commit", cwd=git_dir)
 
-    current_branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], "Failed to get current branch").strip()
-    if current_branch != "main":
-        run_git_command(["git", "branch", "-m", current_branch, "main"], "Failed to rename branch to 'main'")
+        current_branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], "Failed to get current branch", cwd=git_dir).strip()
+        if current_branch != "main":
+            run_git_command(["git", "branch", "-m", current_branch, "main"], "Failed to rename branch to 'main'", cwd=git_dir)
 
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Git repository initialized successfully with 'main' branch in '{git_dir}', including all existing files.{RESET_COLOR}")
     display_tree(git_dir, "After Initialization")
 
@@ -49,13 +45,13 @@ def create_new_branch(version, owner, branch_type, description=None):
     if branch_type not in VALID_TYPES:
         print(f"{HEADING_COLOR}Error: Invalid type '{branch_type}'. Must be one of: feature, bugfix, hotfix, release.{RESET_COLOR}")
         sys.exit(1)
-    if not re.match(r'^\d+\.\d+(?:\.\d+)?$', version):
+    if not VERSION_RE.match(version):
         print(f"{HEADING_COLOR}Error: Version '{version}' must be in X.Y or X.Y.Z format.{RESET_COLOR}")
         sys.exit(1)
-    if not re.match(r'^[a-z]+$', owner):
+    if not OWNER_RE.match(owner):
         print(f"{HEADING_COLOR}Error: Owner '{owner}' must be lowercase letters only.{RESET_COLOR}")
         sys.exit(1)
-    if description and not re.match(r'^[a-z0-9-]+$', description):
+    if description and not DESC_RE.match(description):
         print(f"{HEADING_COLOR}Error: Description '{description}' must be lowercase letters, numbers, or hyphens.{RESET_COLOR}")
         sys.exit(1)
 
@@ -63,23 +59,16 @@ def create_new_branch(version, owner, branch_type, description=None):
     # Hotfixes always branch from main, others from release or main
     base_branch = "main" if branch_type in ["release", "hotfix"] else f"{version}/{owner}/release"
 
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Creating branch {branch}"))
-    animation_thread.start()
-
-    branches = run_git_command(["git", "branch"], "Failed to list branches").strip().splitlines()
-    base_exists = any(b.strip().strip('* ') == base_branch for b in branches)
-    if not base_exists:
-        stop_event.set()
-        animation_thread.join()
-        print(f"{HEADING_COLOR}Error: Base branch '{base_branch}' does not exist. Create it first with 'branch {version} {owner} release' or ensure 'main' exists.{RESET_COLOR}")
-        sys.exit(1)
+    with loading_label(f"Creating branch {branch}"):
+        existing = frozenset(get_local_branches())
+        if base_branch not in existing:
+            stop_loading(failed=True)
+            print(f"{HEADING_COLOR}Error: Base branch '{base_branch}' does not exist. Create it first with 'branch {version} {owner} release' or ensure 'main' exists.{RESET_COLOR}")
+            sys.exit(1)
 
-    run_git_command(["git", "checkout", base_branch], f"Failed to checkout {base_branch}")
-    run_git_command(["git", "checkout", "-b", branch], f"Failed to create branch {branch}")
+        run_git_command(["git", "checkout", base_branch], f"Failed to checkout {base_branch}")
+        run_git_command(["git", "checkout", "-b", branch], f"Failed to create branch {branch}")
 
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Branch '{branch}' created successfully.{RESET_COLOR}")
     current_branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], "Failed to get current branch").strip()
     print(f"{CONTENT_COLOR}Current branch: {current_branch}{RESET_COLOR}")
@@ -91,36 +80,26 @@ def merge_branches(source, target):
     validate_branch_name(source)
     validate_branch_name(target)
 
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Merging {source} into {target}"))
-    animation_thread.start()
+    with loading_label(f"Merging {source} into {target}"):
+        run_git_command(["git", "checkout", target], f"Failed to checkout {target}")
+        status_output = subprocess.run(["git", "status", "--porcelain"], text=True, capture_output=True).stdout
+        if status_output.strip():
+            run_git_command(["git", "add", "."], "Failed to stage changes before merge")
+            run_git_command(["git", "commit", "-m", "Commit before merge"], "Failed to commit changes before merge")
+            print(f"{CONTENT_COLOR}Staged and committed changes on '{target}' before merge.{RESET_COLOR}")
 
-    run_git_command(["git", "checkout", target], f"Failed to checkout {target}")
-    status_output = subprocess.run(["git", "status", "--porcelain"], text=True, capture_output=True).stdout
-    if status_output.strip():
-        run_git_command(["git", "add", "."], "Failed to stage changes before merge")
-        run_git_command(["git", "commit", "-m", "Commit before merge"], "Failed to commit changes before merge")
-        print(f"{CONTENT_COLOR}Staged and committed changes on '{target}' before merge.{RESET_COLOR}")
+        run_git_command(["git", "merge", "--no-ff", source, "-m", f"Merge {source} into {target}"], f"Failed to merge {source} into {target}")
 
-    run_git_command(["git", "merge", "--no-ff", source, "-m", f"Merge {source} into {target}"], f"Failed to merge {source} into {target}")
-
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Merged '{source}' into '{target}' successfully.{RESET_COLOR}")
     display_tree(".", "After Merge")
 
 
 def commit_changes(message):
     """Commit changes with a message."""
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, "Committing changes"))
-    animation_thread.start()
-
-    run_git_command(["git", "add", "."], "Failed to stage changes")
-    run_git_command(["git", "commit", "-m", message], "Failed to commit changes")
+    with loading_label("Committing changes"):
+        run_git_command(["git", "add", "."], "Failed to stage changes")
+        run_git_command(["git", "commit", "-m", message], "Failed to commit changes")
 
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Changes committed with message '{message}'.{RESET_COLOR}")
     display_tree(".", "After Commit")
 
@@ -130,44 +109,37 @@ def push_branch():
     current_branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], "Failed to get current branch").strip()
     validate_branch_name(current_branch)
 
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Pushing {current_branch} to origin"))
-    animation_thread.start()
+    with loading_label(f"Pushing {current_branch} to origin"):
+        # Stage all changes
+        run_git_command(["git", "add", "."], "Failed to stage changes")
 
-    # Stage all changes
-    run_git_command(["git", "add", "."], "Failed to stage changes")
+        # Check if anything was staged; exit code 1 means the index differs from HEAD
+        staged = subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode != 0
+        if staged:
+            # Commit with default "sync" message if there are changes
+            run_git_command(["git", "commit", "-m", "sync"], "Failed to commit changes")
+            print(f"{CONTENT_COLOR}Staged and committed changes with message 'sync'.{RESET_COLOR}")
+        else:
+            print(f"{CONTENT_COLOR}No changes to commit.{RESET_COLOR}")
 
-    # Check if there are changes to commit
-    status_output = subprocess.run(["git", "status", "--porcelain"], text=True, capture_output=True).stdout
-    if status_output.strip():
-        # Commit with default "sync" message if there are changes
-        run_git_command(["git", "commit", "-m", "sync"], "Failed to commit changes")
-        print(f"{CONTENT_COLOR}Staged and committed changes with message 'sync'.{RESET_COLOR}")
-    else:
-        print(f"{CONTENT_COLOR}No changes to commit.{RESET_COLOR}")
-
-    # Check if a remote 'origin' exists
-    try:
-        remotes = run_git_command(["git", "remote"], "Failed to list remotes").strip()
-        if "origin" not in remotes.splitlines():
-            stop_event.set()
-            animation_thread.join()
-            print(f"{HEADING_COLOR}Error: No remote 'origin' configured. Please set up a remote repository first (e.g., 'git remote add origin <url>').{RESET_COLOR}")
+        # Check if a remote 'origin' exists
+        try:
+            remotes = run_git_command(["git", "remote"], "Failed to list remotes").strip()
+            if "origin" not in remotes.splitlines():
+                stop_loading(failed=True)
+                print(f"{HEADING_COLOR}Error: No remote 'origin' configured. Please set up a remote repository first (e.g., 'git remote add origin <url>').{RESET_COLOR}")
+                display_tree(".")
+                sys.exit(1)
+
+            # Push to origin
+            run_git_command(["git", "push", "origin", current_branch], f"Failed to push {current_branch}")
+
+        except subprocess.CalledProcessError as e:
+            stop_loading(failed=True)
+            print(f"{HEADING_COLOR}Error: Push failed: {e.stderr}{RESET_COLOR}")
             display_tree(".")
             sys.exit(1)
 
-        # Push to origin
-        run_git_command(["git", "push", "origin", current_branch], f"Failed to push {current_branch}")
-
-    except subprocess.CalledProcessError as e:
-        stop_event.set()
-        animation_thread.join()
-        print(f"{HEADING_COLOR}Error: Push failed: {e.stderr}{RESET_COLOR}")
-        display_tree(".")
-        sys.exit(1)
-
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Pushed '{current_branch}' to origin successfully.{RESET_COLOR}")
     display_tree(".", "After Push")
 
@@ -176,14 +148,9 @@ def switch_branch(branch):
     """Switch to an existing branch."""
     validate_branch_name(branch)
 
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Switching to {branch}"))
-    animation_thread.start()
+    with loading_label(f"Switching to {branch}"):
+        run_git_command(["git", "checkout", branch], f"Failed to switch to {branch}")
 
-    run_git_command(["git", "checkout", branch], f"Failed to switch to {branch}")
-
-    stop_event.set()
-    animation_thread.join()
     print(f"{CONTENT_COLOR}Switched to '{branch}' successfully.{RESET_COLOR}")
     display_tree(".", "After Switch")
 
@@ -191,33 +158,29 @@ def switch_branch(branch):
 def delete_branches(branches_to_delete, force=False):
     """Delete multiple branches with optional force flag."""
     current_branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], "Failed to get current branch").strip()
-    existing_branches = run_git_command(["git", "branch"], "Failed to list branches").strip().splitlines()
-    existing_branches = [b.strip().strip('* ') for b in existing_branches]
-
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, f"Deleting branches"))
-    animation_thread.start()
-
-    deleted_count = 0
-    for branch in branches_to_delete:
-        validate_branch_name(branch)
-        if branch == current_branch:
-            print(f"{HEADING_COLOR}Error: Cannot delete the current branch '{branch}'. Switch to another branch first.{RESET_COLOR}")
-            continue
-        if branch not in existing_branches:
-            print(f"{HEADING_COLOR}Error: Branch '{branch}' does not exist.{RESET_COLOR}")
-            continue
-
-        delete_cmd = ["git", "branch", "-D" if force else "-d", branch]
-        try:
-            run_git_command(delete_cmd, f"Failed to delete branch {branch}")
-            print(f"{CONTENT_COLOR}Branch '{branch}' deleted successfully.{RESET_COLOR}")
-            deleted_count += 1
-        except SystemExit:
-            continue
-
-    stop_event.set()
-    animation_thread.join()
+
+    with loading_label(f"Deleting branches"):
+        existing = frozenset(get_local_branches())
+        deleted_count = 0
+        for branch in branches_to_delete:
+            validate_branch_name(branch)
+            if branch == current_branch:
+                stop_loading(failed=True)
+                print(f"{HEADING_COLOR}Error: Cannot delete the current branch '{branch}'. Switch to another branch first.{RESET_COLOR}")
+                continue
+            if branch not in existing:
+                stop_loading(failed=True)
+                print(f"{HEADING_COLOR}Error: Branch '{branch}' does not exist.{RESET_COLOR}")
+                continue
+
+            delete_cmd = ["git", "branch", "-D" if force else "-d", branch]
+            try:
+                run_git_command(delete_cmd, f"Failed to delete branch {branch}")
+                print(f"{CONTENT_COLOR}Branch '{branch}' deleted successfully.{RESET_COLOR}")
+                deleted_count += 1
+            except SystemExit:
+                continue
+
     if deleted_count > 0:
         print(f"{CONTENT_COLOR}Deleted {deleted_count} branch(es) successfully.{RESET_COLOR}")
     else:
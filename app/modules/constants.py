@@ -19,6 +19,15 @@ GITGURU_BANNER = r"""
 ==================================================
 """
 
+# Fully colored banner and version line, encoded once for a single write at startup
+BANNER_COLORED = f"{HEADING_COLOR}{GITGURU_BANNER}Version: {VERSION}{RESET_COLOR}\n"
+BANNER_BYTES = BANNER_COLORED.encode()
+
 # Valid branch types and naming pattern
 VALID_TYPES = {'feature', 'bugfix', 'hotfix', 'release'}
 BRANCH_PATTERN = re.compile(r'^\d+\.\d+(?:\.\d+)?/[a-z]+/(feature|bugfix|hotfix|release)(?:/[a-z0-9-]+)?$|^main$')
+
+# Patterns for the individual branch name components
+VERSION_RE = re.compile(r'^\d+\.\d+(?:\.\d+)?$')
+OWNER_RE = re.compile(r'^[a-z]+$')
+DESC_RE = re.compile(r'^[a-z0-9-]+$')
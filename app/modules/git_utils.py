@@ -1,39 +1,91 @@
 import subprocess
 import sys
 from .constants import HEADING_COLOR, RESET_COLOR
+from .ui import stop_loading
 
 
-def run_git_command(cmd, error_message="Git command failed"):
-    """Execute a Git command and handle errors."""
+def run_git_command(cmd, error_message="Git command failed", cwd=None):
+    """Execute a Git command, optionally in another directory, and handle errors."""
     try:
-        result = subprocess.run(cmd, check=True, text=True, capture_output=True)
+        result = subprocess.run(cmd, check=True, text=True, capture_output=True, cwd=cwd)
         return result.stdout
     except subprocess.CalledProcessError as e:
+        stop_loading(failed=True)
         print(f"{HEADING_COLOR}Error: {error_message}: {e.stderr}{RESET_COLOR}")
         sys.exit(1)
 
 
-def get_git_branches(git_dir="."):
-    """Fetch Git branch and commit data using git log --graph --oneline --all --decorate."""
-    import os
-    os.chdir(git_dir)
-    run_git_command(["git", "rev-parse", "--is-inside-work-tree"], "Not a Git repository")
-    branches_output = run_git_command(["git", "branch"], "Failed to fetch branches").strip().splitlines()
+def get_local_branches(git_dir="."):
+    """Return the names of all local branches using one git for-each-ref call."""
+    output = run_git_command(
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"],
+        "Failed to fetch branches", cwd=git_dir
+    )
+    return output.splitlines()
 
+
+def get_repo_state(git_dir="."):
+    """Return a string that changes whenever HEAD or any ref in the repository moves."""
+    # rev-parse fails on an unborn HEAD; the empty output is still a valid state.
+    # The abbreviation is unique in the repository, so it identifies HEAD as well as the full SHA.
+    head = subprocess.run(["git", "rev-parse", "-q", "--verify", "--short", "HEAD"], cwd=git_dir, text=True, capture_output=True)
+    refs = subprocess.run(
+        ["git", "for-each-ref", "--format=%(HEAD)%(objectname) %(refname)"],
+        cwd=git_dir, text=True, capture_output=True
+    )
+    return head.stdout + refs.stdout
+
+
+def describe_head(head_sha, git_dir="."):
+    """Name HEAD when no existing branch is checked out: a detached commit or an unborn branch."""
+    if head_sha:
+        return f"(HEAD detached at {head_sha})"
+    # An unborn branch (fresh init) is still a symbolic ref, it just has no commit yet
+    unborn = subprocess.run(["git", "symbolic-ref", "-q", "--short", "HEAD"], cwd=git_dir, text=True, capture_output=True)
+    return unborn.stdout.strip() or "HEAD"
+
+
+def parse_repo_state(state, git_dir="."):
+    """Return (branches, current_branch) from get_repo_state output."""
     branches = []
     current_branch = None
-    for line in branches_output:
-        line = line.strip()
-        if line.startswith('*'):
-            current_branch = line[2:]
-            branches.append(current_branch)
-        else:
-            branch = line[2:] if line.startswith('  ') else line
+    head_sha = ""
+    for line in state.splitlines():
+        objectname, _, refname = line[1:].partition(" ")
+        if not refname:
+            # The first line is the abbreviated HEAD commit from rev-parse
+            head_sha = line
+        elif refname.startswith("refs/heads/"):
+            branch = refname[len("refs/heads/"):]
             branches.append(branch)
+            if line[0] == "*":
+                current_branch = branch
+    if current_branch is None:
+        current_branch = describe_head(head_sha, git_dir)
+    return branches, current_branch
 
-    log_output = run_git_command(
+
+def iter_git_log(git_dir="."):
+    """Yield git log --graph --oneline --all --decorate lines as git writes them."""
+    process = subprocess.Popen(
         ["git", "log", "--graph", "--oneline", "--all", "--decorate"],
-        "Failed to fetch log"
-    ).strip().splitlines()
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=git_dir
+    )
+    for line in process.stdout:
+        yield line.rstrip("\n")
+    stderr = process.stderr.read()
+    if process.wait() != 0:
+        stop_loading(failed=True)
+        print(f"{HEADING_COLOR}Error: Failed to fetch log: {stderr}{RESET_COLOR}")
+        sys.exit(1)
+
+
+def get_git_branches(git_dir=".", state=None):
+    """Fetch local branches, the current branch and a lazy iterator over the git log graph.
 
-    return branches, current_branch, log_output
+    Passing the output of get_repo_state reuses it instead of querying the refs again.
+    """
+    if state is None:
+        state = get_repo_state(git_dir)
+    branches, current_branch = parse_repo_state(state, git_dir)
+    return branches, current_branch, iter_git_log(git_dir)
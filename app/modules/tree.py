@@ -1,10 +1,40 @@
-import threading
+import os
+import sys
+import json
+import hashlib
 from collections import defaultdict
 from datetime import datetime
 import re
-from .constants import HEADING_COLOR, CONTENT_COLOR, RESET_COLOR
-from .git_utils import run_git_command, get_git_branches
-from .ui import animate_loading
+from .constants import HEADING_COLOR, CONTENT_COLOR, RESET_COLOR, VERSION
+from .git_utils import run_git_command, get_git_branches, get_repo_state
+from .ui import loading_label
+
+# Rendered trees keyed by a digest of the repository state: {key: (tree_text, current_branch)}
+_tree_cache = {}
+
+# File inside .git that keeps the last rendered tree across invocations
+TREE_CACHE_FILE = "gitguru-tree.json"
+
+
+def _load_cached_tree(cache_path, cache_key):
+    """Return (tree_text, current_branch) from the on-disk cache if it matches cache_key."""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("sig") != cache_key:
+        return None
+    return data["tree_text"], data["current_branch"]
+
+
+def _save_cached_tree(cache_path, cache_key, tree_text, current_branch):
+    """Write the rendered tree to the on-disk cache; failures only cost the next run a rebuild."""
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"sig": cache_key, "tree_text": tree_text, "current_branch": current_branch}, f)
+    except OSError:
+        pass
 
 
 def build_branch_tree(branches, current_branch, log_lines):
@@ -14,20 +44,31 @@ def build_branch_tree(branches, current_branch, log_lines):
 
 def display_tree(git_dir=".", label=None):
     """Display the Git branch tree with a custom label."""
-    stop_event = threading.Event()
-    animation_thread = threading.Thread(target=animate_loading, args=(stop_event, "Fetching branches"))
-    animation_thread.start()
-    branches, current_branch, log_lines = get_git_branches(git_dir)
-    tree_lines = build_branch_tree(branches, current_branch, log_lines)
-    stop_event.set()
-    animation_thread.join()
+    state = get_repo_state(git_dir)
+    # The cached text is fully rendered, so a new gitguru version must not reuse an older rendering
+    cache_key = hashlib.sha1(f"{VERSION}\n{state}".encode()).hexdigest()
+    cache_path = os.path.join(git_dir, ".git", TREE_CACHE_FILE)
+    cached = _tree_cache.get(cache_key) or _load_cached_tree(cache_path, cache_key)
+    if cached is None:
+        with loading_label("Fetching branches"):
+            branches, current_branch, log_lines = get_git_branches(git_dir, state)
+            # Join lines as they stream out of git log; the color is uniform, so apply it once
+            tree_text = "\n".join(build_branch_tree(branches, current_branch, log_lines))
+            if tree_text:
+                tree_text = f"{CONTENT_COLOR}{tree_text}{RESET_COLOR}\n"
+        cached = (tree_text, current_branch)
+        _save_cached_tree(cache_path, cache_key, tree_text, current_branch)
+    _tree_cache[cache_key] = cached
+    tree_text, current_branch = cached
 
     if label:
-        print(f"\n{HEADING_COLOR}Git Branch Tree ({label}):{RESET_COLOR}")
+        title = f"{HEADING_COLOR}Git Branch Tree ({label}):{RESET_COLOR}"
     else:
-        print(f"\n{HEADING_COLOR}Git Branch Tree:{RESET_COLOR}")
+        title = f"{HEADING_COLOR}Git Branch Tree:{RESET_COLOR}"
 
-    for line in tree_lines:
-        print(f"{CONTENT_COLOR}{line}{RESET_COLOR}")
-    print(f"\n{HEADING_COLOR}{'=' * 50}{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}Current branch: {current_branch}{RESET_COLOR}")
+    # Emit the whole tree with a single write
+    sys.stdout.write(
+        f"\n{title}\n{tree_text}\n"
+        f"{HEADING_COLOR}{'=' * 50}{RESET_COLOR}\n"
+        f"{CONTENT_COLOR}Current branch: {current_branch}{RESET_COLOR}\n"
+    )
@@ -1,8 +1,15 @@
 import sys
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from .constants import HEADING_COLOR, CONTENT_COLOR, RESET_COLOR
 
+# One worker thread, reused by every loading animation in the process
+_anim_worker = ThreadPoolExecutor(max_workers=1)
+_stop_event = threading.Event()
+# (future, message) of the animation currently on screen, if any
+_active = None
+
 
 def animate_loading(stop_event, message="Processing Git command"):
     """Display a Braille spinner animation until stopped."""
@@ -12,26 +19,59 @@ def animate_loading(stop_event, message="Processing Git command"):
         sys.stdout.write(f"\r{CONTENT_COLOR}{message} {spinner[idx]}{RESET_COLOR}")
         sys.stdout.flush()
         idx = (idx + 1) % len(spinner)
-        time.sleep(0.1)
-    sys.stdout.write(f"\r{CONTENT_COLOR}{message} Done!{RESET_COLOR}\n")
+        # Wakes up as soon as the event is set instead of sleeping out the full frame
+        stop_event.wait(0.1)
+
+
+def stop_loading(failed=False):
+    """Stop the running loading animation, if any, so that following output starts on a clean line."""
+    global _active
+    if _active is None:
+        return
+    future, message = _active
+    _active = None
+    _stop_event.set()
+    future.result()
+    status = "Failed!" if failed else "Done!"
+    sys.stdout.write(f"\r{CONTENT_COLOR}{message} {status}{RESET_COLOR}\n")
     sys.stdout.flush()
 
 
+@contextmanager
+def loading_label(message="Processing Git command"):
+    """Show the loading animation while the block runs; the yielded callable stops it early."""
+    global _active
+    if sys.stdout.isatty():
+        _stop_event.clear()
+        _active = (_anim_worker.submit(animate_loading, _stop_event, message), message)
+    try:
+        yield stop_loading
+    finally:
+        # An exception in flight (including sys.exit) means the operation did not finish
+        stop_loading(failed=sys.exc_info()[0] is not None)
+
+
+# Help text, colored once at import; only the script path is filled in per call
+_COMMANDS_TEXT = "\n".join([
+    f"{HEADING_COLOR}Available Commands:{RESET_COLOR}",
+    f"{CONTENT_COLOR}  init [git_dir]                             Initialize a new Git repository (defaults to PWD if git_dir omitted){RESET_COLOR}",
+    f"{CONTENT_COLOR}  view [git_dir]                             Visualize branch tree (defaults to PWD if git_dir omitted){RESET_COLOR}",
+    f"{CONTENT_COLOR}  new <version> <owner> <type> [desc]        Create a new branch (type must be: feature, bugfix, hotfix, release){RESET_COLOR}",
+    f"{CONTENT_COLOR}  merge <source> <target>                    Merge source into target (auto-commits changes before merge){RESET_COLOR}",
+    f"{CONTENT_COLOR}  commit <message>                           Commit changes{RESET_COLOR}",
+    f"{CONTENT_COLOR}  push                                       Push current branch to origin{RESET_COLOR}",
+    f"{CONTENT_COLOR}  switch <branch>                            Switch to a branch{RESET_COLOR}",
+    f"{CONTENT_COLOR}  delete <branch1> [branch2] ... [--force]   Delete one or more branches (use --force for unmerged branches){RESET_COLOR}",
+    f"{CONTENT_COLOR}  cto-hotfix <version>                       Quickly get the CTO working on a hotfix branch{RESET_COLOR}",
+    f"{CONTENT_COLOR}  cto-hotfix-push <version>                  Merge and push the hotfix to main{RESET_COLOR}",
+    f"{HEADING_COLOR}Examples:{RESET_COLOR}",
+    f"{CONTENT_COLOR}  {{script_path}} init /path/to/repo{RESET_COLOR}",
+    f"{CONTENT_COLOR}  {{script_path}} view /path/to/repo{RESET_COLOR}",
+    f"{CONTENT_COLOR}  {{script_path}} new 0.0.1 tom feature test-feature{RESET_COLOR}",
+    f"{CONTENT_COLOR}  {{script_path}} merge 0.0.1/tom/feature/test-feature 0.0.1/tom/release{RESET_COLOR}",
+]) + "\n"
+
+
 def display_commands(script_path):
     """Display available commands."""
-    print(f"{HEADING_COLOR}Available Commands:{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  init [git_dir]                             Initialize a new Git repository (defaults to PWD if git_dir omitted){RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  view [git_dir]                             Visualize branch tree (defaults to PWD if git_dir omitted){RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  new <version> <owner> <type> [desc]        Create a new branch (type must be: feature, bugfix, hotfix, release){RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  merge <source> <target>                    Merge source into target (auto-commits changes before merge){RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  commit <message>                           Commit changes{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  push                                       Push current branch to origin{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  switch <branch>                            Switch to a branch{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  delete <branch1> [branch2] ... [--force]   Delete one or more branches (use --force for unmerged branches){RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  cto-hotfix <version>                       Quickly get the CTO working on a hotfix branch{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  cto-hotfix-push <version>                  Merge and push the hotfix to main{RESET_COLOR}")
-    print(f"{HEADING_COLOR}Examples:{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  {script_path} init /path/to/repo{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  {script_path} view /path/to/repo{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  {script_path} new 0.0.1 tom feature test-feature{RESET_COLOR}")
-    print(f"{CONTENT_COLOR}  {script_path} merge 0.0.1/tom/feature/test-feature 0.0.1/tom/release{RESET_COLOR}")
+    sys.stdout.write(_COMMANDS_TEXT.format(script_path=script_path))
@@ -14,47 +14,67 @@ All published files will be placed under:
 SSH details are read from ~/.rgwfuncsrc under the preset "icdattcwsm".
 """
 import os
+import functools
 import subprocess
 import shutil
 import json
 import re
 from packaging.version import parse as parse_version
 import tempfile
-import ast
 import sys
-import importlib.util
+from importlib.metadata import packages_distributions
 
 # Optionally force a new major version (set to an integer, e.g., 1) or leave as None
 MAJOR_RELEASE_NUMBER = 0
 
+# All ssh and rsync calls share one multiplexed SSH connection through a control socket.
+# ssh requires the socket's directory to be private, so it lives in a 0700 mkdtemp dir
+# created on the first ssh or rsync call and removed by close_ssh_master.
+ssh_control_dir = None
+
+# Patterns for the VERSION assignment in constants.py and published .deb file names
+VERSION_ASSIGNMENT_RE = re.compile(r'VERSION\s*=\s*"[^"]*"')
+DEB_FILENAME_RE = re.compile(r"^gitguru_(\d+\.\d+\.\d+)(?:-(\d+))?_amd64\.deb$")
+# Matches 'from <module> import ...' and 'import <name>[, <name> ...]' at the start of a line.
+# String literals and comments are matched first (with empty groups) so that import-like
+# lines inside docstrings are consumed and never reach the import alternatives.
+# Statements after a ';' on the same line are not seen.
+IMPORT_RE = re.compile(
+    r'"""(?:\\[\s\S]|[^\\])*?"""|\'\'\'(?:\\[\s\S]|[^\\])*?\'\'\''
+    r'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|#[^\n]*'
+    r"|^[ \t]*(?:from[ \t]+([.\w]+)[ \t]+import\b|import[ \t]+([^\n#;]+))",
+    re.M
+)
+
 ###############################################################################
 # UTILITY TO FIND IMPORTED PACKAGES
 ###############################################################################
 
 
+def scan_file_imports(filepath):
+    """Return the top-level package names imported by a single Python file."""
+    packages = set()
+    with open(filepath, "r", encoding="utf-8") as f:
+        source = f.read()
+    for from_module, import_names in IMPORT_RE.findall(source):
+        # Strings and comments match with both groups empty
+        names = [from_module] if from_module else import_names.split(",")
+        for name in names:
+            words = name.split()
+            # Relative imports name internal modules, never packages
+            if words and not words[0].startswith(".") and words[0] != "\\":
+                packages.add(words[0].split(".")[0])
+    return packages
+
+
 def get_imported_packages(directory):
     """Recursively find all imported packages in Python files within a directory."""
     imported_packages = set()
-
+    # app/ holds a handful of small files; a pool's startup would cost more than the scan
     for root, _, files in os.walk(directory):
         for filename in files:
             if filename.endswith(".py"):
-                filepath = os.path.join(root, filename)
-                with open(filepath, "r", encoding="utf-8") as f:
-                    try:
-                        tree = ast.parse(f.read(), filename=filepath)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.Import):
-                                for name in node.names:
-                                    pkg = name.name.split(".")[0]
-                                    imported_packages.add(pkg)
-                            elif isinstance(node, ast.ImportFrom):
-                                if node.module:
-                                    pkg = node.module.split(".")[0]
-                                    imported_packages.add(pkg)
-                    except SyntaxError:
-                        print(f"[WARNING] Syntax error in {filepath}, skipping...")
-                        continue
+                imported_packages |= scan_file_imports(os.path.join(root, filename))
 
     stdlib = set(sys.stdlib_module_names)
     return {pkg for pkg in imported_packages if pkg not in stdlib and not pkg.startswith(".")}
@@ -68,6 +88,9 @@ def filter_external_packages(packages, app_dir):
     """Filter out internal modules and keep only external packages."""
     external_pkgs = set()
     internal_modules = {'modules'}
+    # Top-level import names of every installed distribution, resolved in one metadata scan
+    # the first time a package survives the cheap filters
+    installed_pkgs = None
 
     for pkg in packages:
         if pkg in internal_modules:
@@ -77,8 +100,9 @@ def filter_external_packages(packages, app_dir):
         if os.path.exists(pkg_path + ".py") or os.path.isdir(pkg_path):
             continue
 
-        spec = importlib.util.find_spec(pkg)
-        if spec and spec.origin and "site-packages" in spec.origin:
+        if installed_pkgs is None:
+            installed_pkgs = packages_distributions()
+        if pkg in installed_pkgs:
             external_pkgs.add(pkg)
 
     return external_pkgs
@@ -96,9 +120,7 @@ def generate_lean_requirements(app_dir, output_path):
     external_pkgs = filter_external_packages(imported_pkgs, app_dir)
     print(f"[INFO] Filtered external packages: {external_pkgs}")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for pkg in sorted(external_pkgs):
-            f.write(f"{pkg}\n")
+    replace_file(output_path, "".join(f"{pkg}\n" for pkg in sorted(external_pkgs)))
     print(f"[INFO] Generated lean requirements.txt at {output_path} with {len(external_pkgs)} packages")
 
 ###############################################################################
@@ -114,22 +136,19 @@ def update_config_version(new_version):
     with open(config_path, "r", encoding="utf-8") as f:
         contents = f.read()
 
-    updated_contents = re.sub(
-        r'VERSION\s*=\s*"[^"]*"',
-        f'VERSION = "{new_version}"',
-        contents
-    )
+    updated_contents = VERSION_ASSIGNMENT_RE.sub(f'VERSION = "{new_version}"', contents)
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        f.write(updated_contents)
+    replace_file(config_path, updated_contents)
     print(f"[INFO] Updated constants.py version to: {new_version}")
 
 ###############################################################################
-# GET NEW VERSION
+# SSH PRESET AND SHARED CONNECTION
 ###############################################################################
 
 
-def get_new_version(MAJOR_RELEASE_NUMBER=None):
+@functools.lru_cache(maxsize=1)
+def get_rgwfuncs_preset(name="icdattcwsm"):
+    """Return (host, ssh_user, ssh_key_path) for a vm preset in ~/.rgwfuncsrc, parsing the file only once."""
     config_path = os.path.expanduser("~/.rgwfuncsrc")
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Cannot find config file: {config_path}")
@@ -138,20 +157,64 @@ def get_new_version(MAJOR_RELEASE_NUMBER=None):
         data = json.load(f)
 
     vm_presets = data.get("vm_presets", [])
-    preset = next((p for p in vm_presets if p.get("name") == "icdattcwsm"), None)
+    preset = next((p for p in vm_presets if p.get("name") == name), None)
     if not preset:
-        raise ValueError("No preset named 'icdattcwsm' found in ~/.rgwfuncsrc")
-    host = preset["host"]
-    ssh_user = preset["ssh_user"]
-    ssh_key_path = preset["ssh_key_path"]
+        raise ValueError(f"No preset named '{name}' found in ~/.rgwfuncsrc")
+    return preset["host"], preset["ssh_user"], preset["ssh_key_path"]
+
+
+def ssh_multiplex_options():
+    """Return the ssh options for the shared connection, creating the socket's private directory on first use."""
+    global ssh_control_dir
+    if ssh_control_dir is None:
+        ssh_control_dir = tempfile.mkdtemp(prefix="gitguru-publish-")
+    control_path = os.path.join(ssh_control_dir, "ssh.sock")
+    return ["-o", "ControlMaster=auto", "-o", f"ControlPath={control_path}", "-o", "ControlPersist=60"]
+
+
+def ssh_argv(ssh_key_path, ssh_user, host, *remote_cmd):
+    """Build an ssh argv over the shared connection; remote_cmd is run by the remote shell."""
+    return ["ssh", *ssh_multiplex_options(), "-i", ssh_key_path, f"{ssh_user}@{host}", *remote_cmd]
+
+
+def rsync_argv(ssh_key_path, *args):
+    """Build an rsync argv whose transport reuses the shared SSH connection."""
+    ssh_transport = " ".join(["ssh", *ssh_multiplex_options(), "-i", ssh_key_path])
+    return ["rsync", "-avz", "-e", ssh_transport, *args]
+
+
+def close_ssh_master():
+    """Close the multiplexed SSH connection if one was opened and remove its private directory."""
+    global ssh_control_dir
+    if ssh_control_dir is None:
+        return
+    control_path = os.path.join(ssh_control_dir, "ssh.sock")
+    try:
+        if os.path.exists(control_path):
+            host, ssh_user, _ = get_rgwfuncs_preset()
+            subprocess.call(
+                ["ssh", "-o", f"ControlPath={control_path}", "-O", "exit", f"{ssh_user}@{host}"],
+                stderr=subprocess.DEVNULL
+            )
+    finally:
+        shutil.rmtree(ssh_control_dir, ignore_errors=True)
+        ssh_control_dir = None
+
+###############################################################################
+# GET NEW VERSION
+###############################################################################
+
+
+def get_new_version(MAJOR_RELEASE_NUMBER=None):
+    host, ssh_user, ssh_key_path = get_rgwfuncs_preset()
 
     remote_deb_dir = "/home/rgw/Apps/frontend-sites/files.ryangerardwilson.com/gitguru/debian/dists/stable/main/binary-amd64"
-    ssh_cmd = (
-        f"ssh -i {ssh_key_path} {ssh_user}@{host} "
-        f"\"find {remote_deb_dir} -maxdepth 1 -type f -name 'gitguru_*.deb'\""
+    ssh_cmd = ssh_argv(
+        ssh_key_path, ssh_user, host,
+        f"find {remote_deb_dir} -maxdepth 1 -type f -name 'gitguru_*.deb'"
     )
     try:
-        output = subprocess.check_output(ssh_cmd, shell=True).decode("utf-8").strip()
+        output = subprocess.check_output(ssh_cmd).decode("utf-8").strip()
     except subprocess.CalledProcessError:
         output = ""
 
@@ -166,7 +229,7 @@ def get_new_version(MAJOR_RELEASE_NUMBER=None):
     deb_file_path = output.split("\n")[-1].strip()
     filename = os.path.basename(deb_file_path)
 
-    match = re.match(r"^gitguru_(\d+\.\d+\.\d+)(?:-(\d+))?_amd64\.deb$", filename)
+    match = DEB_FILENAME_RE.match(filename)
     if not match:
         raise ValueError(f"Could not parse version from deb file name: {filename}")
 
@@ -207,25 +270,16 @@ def get_new_version(MAJOR_RELEASE_NUMBER=None):
 
 
 def remove_old_remote_debs():
-    config_path = os.path.expanduser("~/.rgwfuncsrc")
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    vm_presets = data.get("vm_presets", [])
-    preset = next((p for p in vm_presets if p.get("name") == "icdattcwsm"), None)
-    if not preset:
-        raise ValueError("No preset named 'icdattcwsm' found in ~/.rgwfuncsrc")
-    host = preset["host"]
-    ssh_user = preset["ssh_user"]
-    ssh_key_path = preset["ssh_key_path"]
+    host, ssh_user, ssh_key_path = get_rgwfuncs_preset()
     remote_deb_dir = "/home/rgw/Apps/frontend-sites/files.ryangerardwilson.com/gitguru/debian/dists/stable/main/binary-amd64"
 
-    ssh_cmd = (
-        f"ssh -i {ssh_key_path} {ssh_user}@{host} "
-        f"\"[ -d {remote_deb_dir} ] && rm -f {remote_deb_dir}/gitguru_*.deb || echo 'Directory does not exist, skipping removal'\""
+    ssh_cmd = ssh_argv(
+        ssh_key_path, ssh_user, host,
+        f"[ -d {remote_deb_dir} ] && rm -f {remote_deb_dir}/gitguru_*.deb || echo 'Directory does not exist, skipping removal'"
     )
     print("[INFO] Attempting to remove remote .deb files if directory exists...")
     try:
-        output = subprocess.check_output(ssh_cmd, shell=True).decode("utf-8").strip()
+        output = subprocess.check_output(ssh_cmd).decode("utf-8").strip()
         if output:
             print(f"[INFO] Remote output: {output}")
         else:
@@ -233,28 +287,56 @@ def remove_old_remote_debs():
     except subprocess.CalledProcessError as e:
         print(f"[WARNING] Failed to execute removal command: {e.output.decode('utf-8')}")
 
+###############################################################################
+# HARDLINK COPY OF THE APP TREE
+###############################################################################
+
+
+def replace_file(path, contents):
+    """Write contents to a new inode at path, leaving hard links in earlier build folders untouched."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(contents)
+    os.replace(tmp_path, path)
+
+
+def hardlink_tree(src, dst):
+    """Mirror src into dst using hard links, copying only where linking is not possible."""
+    for root, _, files in os.walk(src):
+        target_dir = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in files:
+            src_path = os.path.join(root, filename)
+            dst_path = os.path.join(target_dir, filename)
+            if os.path.exists(dst_path):
+                os.remove(dst_path)
+            try:
+                os.link(src_path, dst_path)
+            except OSError:
+                # Cross-device builds or filesystems without hard links
+                shutil.copy2(src_path, dst_path)
+
 ###############################################################################
 # PUBLISH RELEASE
 ###############################################################################
 
 
-def publish_release(version):
-    def build_deb(version):
-        print("[INFO] Starting build_deb step…")
-        update_config_version(version)
+def build_deb(version):
+    print("[INFO] Starting build_deb step…")
+    update_config_version(version)
 
-        build_root = os.path.join("debian", "version_build_folders", f"gitguru_{version}")
-        if os.path.exists(build_root):
-            shutil.rmtree(build_root)
-        os.makedirs(build_root, exist_ok=True)
+    build_root = os.path.join("debian", "version_build_folders", f"gitguru_{version}")
+    if os.path.exists(build_root):
+        shutil.rmtree(build_root)
+    os.makedirs(build_root, exist_ok=True)
 
-        out_debs_dir = os.path.join("debian", "version_debs")
-        os.makedirs(out_debs_dir, exist_ok=True)
+    out_debs_dir = os.path.join("debian", "version_debs")
+    os.makedirs(out_debs_dir, exist_ok=True)
 
-        debian_dir = os.path.join(build_root, "DEBIAN")
-        os.makedirs(debian_dir, exist_ok=True)
+    debian_dir = os.path.join(build_root, "DEBIAN")
+    os.makedirs(debian_dir, exist_ok=True)
 
-        control_content = f"""Package: gitguru
+    control_content = f"""Package: gitguru
 Version: {version}
 Section: utils
 Priority: optional
@@ -264,92 +346,98 @@ Maintainer: Your Name <ryangerardwilson@gmail.com>
 Description: GitGuru - A Git branch management tool
  GitGuru is a command-line tool for managing Git branches with a structured naming convention.
 """
-        control_path = os.path.join(debian_dir, "control")
-        with open(control_path, "w", encoding="utf-8") as f:
-            f.write(control_content)
-        print(f"[INFO] Created control file at {control_path}")
+    control_path = os.path.join(debian_dir, "control")
+    with open(control_path, "w", encoding="utf-8") as f:
+        f.write(control_content)
+    print(f"[INFO] Created control file at {control_path}")
+
+    usr_bin_dir = os.path.join(build_root, "usr", "bin")
+    usr_lib_dir = os.path.join(build_root, "usr", "lib", "gitguru")
+    os.makedirs(usr_bin_dir, exist_ok=True)
+    os.makedirs(usr_lib_dir, exist_ok=True)
 
-        usr_bin_dir = os.path.join(build_root, "usr", "bin")
-        usr_lib_dir = os.path.join(build_root, "usr", "lib", "gitguru")
-        os.makedirs(usr_bin_dir, exist_ok=True)
-        os.makedirs(usr_lib_dir, exist_ok=True)
+    # Generate requirements.txt before linking so the build tree gets the fresh file directly
+    requirements_path = os.path.join("app", "requirements.txt")
+    generate_lean_requirements("app", requirements_path)
 
-        shutil.copytree("app", os.path.join(usr_lib_dir, "app"), dirs_exist_ok=True)
-        print(f"[INFO] Copied app directory to {usr_lib_dir}")
+    hardlink_tree("app", os.path.join(usr_lib_dir, "app"))
+    print(f"[INFO] Linked app directory into {usr_lib_dir}")
 
-        bin_script = os.path.join(usr_bin_dir, "gitguru")
-        script_content = """#!/bin/bash
+    bin_script = os.path.join(usr_bin_dir, "gitguru")
+    script_content = """#!/bin/bash
 PYTHONPATH=/usr/lib/gitguru/site-packages python3 /usr/lib/gitguru/app/main.py "$@"
 """
-        with open(bin_script, "w", encoding="utf-8") as f:
-            f.write(script_content)
-        os.chmod(bin_script, 0o755)
-        print(f"[INFO] Created executable script at {bin_script}")
-
-        requirements_path = os.path.join("app", "requirements.txt")
-        generate_lean_requirements("app", requirements_path)
-
-        pip_cmd = [
-            "pip3", "install", "-r", requirements_path,
-            "--target", os.path.join(usr_lib_dir, "site-packages"),
-            "--no-deps"
-        ]
-        try:
-            subprocess.check_call(pip_cmd)
-            print(f"[INFO] Installed dependencies to {usr_lib_dir}/site-packages")
-            print(f"[DEBUG] Site-packages contents: {os.listdir(os.path.join(usr_lib_dir, 'site-packages'))}")
-        except subprocess.CalledProcessError as e:
-            print(f"[ERROR] Failed to install dependencies: {e}")
-            raise
-
-        output_deb = os.path.join(out_debs_dir, f"gitguru_{version}_amd64.deb")
-        subprocess.check_call(["dpkg-deb", "--build", build_root, output_deb])
-        print(f"[INFO] Built new .deb: {output_deb}")
-
-    def prepare_deb_for_distribution(version):
-        print("[INFO] Starting prepare_deb_for_distribution step…")
-        stable_dir = os.path.join("debian", "dists", "stable")
-        if os.path.exists(stable_dir):
-            shutil.rmtree(stable_dir)
-        apt_binary_dir = os.path.join(stable_dir, "main", "binary-amd64")
-        os.makedirs(apt_binary_dir, exist_ok=True)
-
-        overrides_path = os.path.join(apt_binary_dir, "overrides.txt")
-        if not os.path.exists(overrides_path):
-            with open(overrides_path, "w", encoding="utf-8") as f:
-                f.write("gitguru optional utils\n")
-        print(f"[INFO] Verified overrides.txt at {overrides_path}")
-
-        deb_source = os.path.join("debian", "version_debs", f"gitguru_{version}_amd64.deb")
-        if not os.path.exists(deb_source):
-            raise FileNotFoundError(f"{deb_source} not found.")
-        shutil.copy2(deb_source, apt_binary_dir)
-        print(f"[INFO] Copied {deb_source} into {apt_binary_dir}")
-
-        packages_path = os.path.join(apt_binary_dir, "Packages")
-        pkg_cmd = ["dpkg-scanpackages", "--multiversion", ".", "overrides.txt"]
-        with open(packages_path, "w", encoding="utf-8") as f:
-            subprocess.check_call(pkg_cmd, cwd=apt_binary_dir, stdout=f)
-        print(f"[INFO] Created Packages file at {packages_path}")
-
-        new_lines = []
-        prefix = "dists/stable/main/binary-amd64/"
-        with open(packages_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("Filename: ./"):
-                    line = line.replace("Filename: ./", f"Filename: {prefix}")
-                new_lines.append(line)
-        with open(packages_path, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
-        print("[INFO] Adjusted Filename entries in Packages file.")
-
-        packages_gz_path = os.path.join(apt_binary_dir, "Packages.gz")
-        with open(packages_gz_path, "wb") as f_out:
-            subprocess.check_call(["gzip", "-9c", "Packages"], cwd=apt_binary_dir, stdout=f_out)
-        print(f"[INFO] Created {packages_gz_path}")
-
-        apt_ftppath = os.path.join(stable_dir, "apt-ftparchive.conf")
-        conf_content = """APT::FTPArchive::Release {
+    with open(bin_script, "w", encoding="utf-8") as f:
+        f.write(script_content)
+    os.chmod(bin_script, 0o755)
+    print(f"[INFO] Created executable script at {bin_script}")
+
+    pip_cmd = [
+        "pip3", "install", "-r", requirements_path,
+        "--target", os.path.join(usr_lib_dir, "site-packages"),
+        "--no-deps"
+    ]
+    try:
+        subprocess.check_call(pip_cmd)
+        print(f"[INFO] Installed dependencies to {usr_lib_dir}/site-packages")
+        print(f"[DEBUG] Site-packages contents: {os.listdir(os.path.join(usr_lib_dir, 'site-packages'))}")
+    except subprocess.CalledProcessError as e:
+        print(f"[ERROR] Failed to install dependencies: {e}")
+        raise
+
+    output_deb = os.path.join(out_debs_dir, f"gitguru_{version}_amd64.deb")
+    subprocess.check_call(["dpkg-deb", "--build", build_root, output_deb])
+    print(f"[INFO] Built new .deb: {output_deb}")
+
+
+def prepare_deb_for_distribution(version):
+    print("[INFO] Starting prepare_deb_for_distribution step…")
+    stable_dir = os.path.join("debian", "dists", "stable")
+    if os.path.exists(stable_dir):
+        shutil.rmtree(stable_dir)
+    apt_binary_dir = os.path.join(stable_dir, "main", "binary-amd64")
+    os.makedirs(apt_binary_dir, exist_ok=True)
+
+    overrides_path = os.path.join(apt_binary_dir, "overrides.txt")
+    if not os.path.exists(overrides_path):
+        with open(overrides_path, "w", encoding="utf-8") as f:
+            f.write("gitguru optional utils\n")
+    print(f"[INFO] Verified overrides.txt at {overrides_path}")
+
+    deb_source = os.path.join("debian", "version_debs", f"gitguru_{version}_amd64.deb")
+    if not os.path.exists(deb_source):
+        raise FileNotFoundError(f"{deb_source} not found.")
+    shutil.copy2(deb_source, apt_binary_dir)
+    print(f"[INFO] Copied {deb_source} into {apt_binary_dir}")
+
+    # Stream dpkg-scanpackages through the Filename rewrite in memory, then write
+    # Packages and feed the same buffer to gzip instead of re-reading the file
+    packages_path = os.path.join(apt_binary_dir, "Packages")
+    pkg_cmd = ["dpkg-scanpackages", "--multiversion", ".", "overrides.txt"]
+    prefix = b"Filename: dists/stable/main/binary-amd64/"
+    packages = bytearray()
+    scan = subprocess.Popen(pkg_cmd, cwd=apt_binary_dir, stdout=subprocess.PIPE)
+    for line in scan.stdout:
+        if line.startswith(b"Filename: ./"):
+            line = prefix + line[len(b"Filename: ./"):]
+        packages += line
+    if scan.wait() != 0:
+        raise subprocess.CalledProcessError(scan.returncode, pkg_cmd)
+
+    with open(packages_path, "wb") as f:
+        f.write(packages)
+    print(f"[INFO] Created Packages file at {packages_path} with adjusted Filename entries")
+
+    packages_gz_path = os.path.join(apt_binary_dir, "Packages.gz")
+    with open(packages_gz_path, "wb") as f_out:
+        gzip_proc = subprocess.Popen(["gzip", "-9c"], stdin=subprocess.PIPE, stdout=f_out)
+        gzip_proc.communicate(packages)
+    if gzip_proc.returncode != 0:
+        raise subprocess.CalledProcessError(gzip_proc.returncode, ["gzip", "-9c"])
+    print(f"[INFO] Created {packages_gz_path}")
+
+    apt_ftppath = os.path.join(stable_dir, "apt-ftparchive.conf")
+    conf_content = """APT::FTPArchive::Release {
   Origin "gitguruRepo";
   Label "gitguruRepo";
   Suite "stable";
@@ -358,69 +446,66 @@ PYTHONPATH=/usr/lib/gitguru/site-packages python3 /usr/lib/gitguru/app/main.py "
   Components "main";
 };
 """
-        with open(apt_ftppath, "w", encoding="utf-8") as f:
-            f.write(conf_content)
-
-        release_path = os.path.join(stable_dir, "Release")
-        apt_ftparchive_cmd = ["apt-ftparchive", "-c", "apt-ftparchive.conf", "release", "."]
-        with open(release_path, "w", encoding="utf-8") as rf:
-            subprocess.check_call(apt_ftparchive_cmd, cwd=stable_dir, stdout=rf)
-        print(f"[INFO] Created Release file at {release_path}")
-
-        sign_cmd = [
-            "gpg", "--local-user", "172E2D67FB733C7EB47DEA047FE8FD47C68DC85A",
-            "--detach-sign", "--armor", "--output", "Release.gpg", "Release"
-        ]
-        subprocess.check_call(sign_cmd, cwd=stable_dir)
-        print("[INFO] Signed Release file (Release.gpg created).")
-
-    def push_to_server():
-        print("[INFO] Starting push_to_server step…")
-        funcs_path = os.path.expanduser("~/.rgwfuncsrc")
-        with open(funcs_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        vm_presets = data.get("vm_presets", [])
-        preset = next((p for p in vm_presets if p.get("name") == "icdattcwsm"), None)
-        host = preset["host"]
-        ssh_user = preset["ssh_user"]
-        ssh_key_path = preset["ssh_key_path"]
-        remote_path = "/home/rgw/Apps/frontend-sites/files.ryangerardwilson.com/gitguru"
-
-        ssh_cmd = f"ssh -i {ssh_key_path} {ssh_user}@{host} 'rm -rf {remote_path}/debian'"
-        subprocess.check_call(ssh_cmd, shell=True)
-
-        rsync_cmd = (
-            f"rsync -avz -e 'ssh -i {ssh_key_path}' "
-            "--exclude 'version_build_folders' --exclude 'version_debs' "
-            f"debian/ {ssh_user}@{host}:{remote_path}/debian"
-        )
-        subprocess.check_call(rsync_cmd, shell=True)
-        print("[INFO] push_to_server completed successfully.")
-
-    def delete_all_but_last_version_build_folders():
-        build_folders_path = os.path.join("debian", "version_build_folders")
-        if not os.path.exists(build_folders_path):
-            return
-        version_folders = [f for f in os.listdir(build_folders_path)
-                           if os.path.isdir(os.path.join(build_folders_path, f)) and f.startswith("gitguru_")]
-        version_folders.sort(key=lambda x: parse_version(x.split('_')[1]), reverse=True)
-        for folder in version_folders[1:]:
-            folder_path = os.path.join(build_folders_path, folder)
-            print(f"[INFO] Deleting old build folder: {folder_path}")
-            shutil.rmtree(folder_path)
-
-    def delete_all_but_last_version_debs():
-        debs_dir = os.path.join("debian", "version_debs")
-        if not os.path.exists(debs_dir):
-            return
-        deb_files = [f for f in os.listdir(debs_dir)
-                     if os.path.isfile(os.path.join(debs_dir, f)) and f.endswith(".deb")]
-        deb_files.sort(key=lambda x: parse_version(x.split('_')[1].replace("_amd64.deb", "")), reverse=True)
-        for deb in deb_files[1:]:
-            deb_path = os.path.join(debs_dir, deb)
-            print(f"[INFO] Deleting old .deb file: {deb_path}")
-            os.remove(deb_path)
+    with open(apt_ftppath, "w", encoding="utf-8") as f:
+        f.write(conf_content)
+
+    release_path = os.path.join(stable_dir, "Release")
+    apt_ftparchive_cmd = ["apt-ftparchive", "-c", "apt-ftparchive.conf", "release", "."]
+    with open(release_path, "w", encoding="utf-8") as rf:
+        subprocess.check_call(apt_ftparchive_cmd, cwd=stable_dir, stdout=rf)
+    print(f"[INFO] Created Release file at {release_path}")
+
+    sign_cmd = [
+        "gpg", "--local-user", "172E2D67FB733C7EB47DEA047FE8FD47C68DC85A",
+        "--detach-sign", "--armor", "--output", "Release.gpg", "Release"
+    ]
+    subprocess.check_call(sign_cmd, cwd=stable_dir)
+    print("[INFO] Signed Release file (Release.gpg created).")
+
+
+def push_to_server():
+    print("[INFO] Starting push_to_server step…")
+    host, ssh_user, ssh_key_path = get_rgwfuncs_preset()
+    remote_path = "/home/rgw/Apps/frontend-sites/files.ryangerardwilson.com/gitguru"
+
+    subprocess.check_call(ssh_argv(ssh_key_path, ssh_user, host, "rm", "-rf", f"{remote_path}/debian"))
+
+    rsync_cmd = rsync_argv(
+        ssh_key_path,
+        "--exclude", "version_build_folders", "--exclude", "version_debs",
+        "debian/", f"{ssh_user}@{host}:{remote_path}/debian"
+    )
+    subprocess.check_call(rsync_cmd)
+    print("[INFO] push_to_server completed successfully.")
+
+
+def delete_all_but_last_version_build_folders():
+    build_folders_path = os.path.join("debian", "version_build_folders")
+    if not os.path.exists(build_folders_path):
+        return
+    version_folders = [f for f in os.listdir(build_folders_path)
+                       if os.path.isdir(os.path.join(build_folders_path, f)) and f.startswith("gitguru_")]
+    version_folders.sort(key=lambda x: parse_version(x.split('_')[1]), reverse=True)
+    for folder in version_folders[1:]:
+        folder_path = os.path.join(build_folders_path, folder)
+        print(f"[INFO] Deleting old build folder: {folder_path}")
+        shutil.rmtree(folder_path)
+
+
+def delete_all_but_last_version_debs():
+    debs_dir = os.path.join("debian", "version_debs")
+    if not os.path.exists(debs_dir):
+        return
+    deb_files = [f for f in os.listdir(debs_dir)
+                 if os.path.isfile(os.path.join(debs_dir, f)) and f.endswith(".deb")]
+    deb_files.sort(key=lambda x: parse_version(x.split('_')[1].replace("_amd64.deb", "")), reverse=True)
+    for deb in deb_files[1:]:
+        deb_path = os.path.join(debs_dir, deb)
+        print(f"[INFO] Deleting old .deb file: {deb_path}")
+        os.remove(deb_path)
+
 
+def publish_release(version):
     build_deb(version)
     prepare_deb_for_distribution(version)
     remove_old_remote_debs()
@@ -460,53 +545,42 @@ echo "Installation complete. GitGuru is now available at /usr/bin/gitguru."
 
     local_pubkey = "/home/rgw/Documents/credentials/pubkey.gpg"
 
-    funcs_path = os.path.expanduser("~/.rgwfuncsrc")
-    with open(funcs_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    vm_presets = data.get("vm_presets", [])
-    preset = next((p for p in vm_presets if p.get("name") == "icdattcwsm"), None)
-    if not preset:
-        raise ValueError("No preset named 'icdattcwsm' found in ~/.rgwfuncsrc")
-    host = preset["host"]
-    ssh_user = preset["ssh_user"]
-    ssh_key_path = preset["ssh_key_path"]
+    host, ssh_user, ssh_key_path = get_rgwfuncs_preset()
 
     remote_base_path = "/home/rgw/Apps/frontend-sites/files.ryangerardwilson.com/gitguru"
     remote_install_path = f"{remote_base_path}/install.sh"
     remote_debian_path = f"{remote_base_path}/debian"
 
     # Ensure remote debian directory exists
-    ssh_cmd = f"ssh -i {ssh_key_path} {ssh_user}@{host} 'mkdir -p {remote_debian_path}'"
-    subprocess.check_call(ssh_cmd, shell=True)
+    subprocess.check_call(ssh_argv(ssh_key_path, ssh_user, host, "mkdir", "-p", remote_debian_path))
 
     # Upload install.sh
-    rsync_cmd = (
-        f"rsync -avz -e 'ssh -i {ssh_key_path}' {local_install_script} {ssh_user}@{host}:{remote_install_path}"
-    )
-    subprocess.check_call(rsync_cmd, shell=True)
+    rsync_cmd = rsync_argv(ssh_key_path, local_install_script, f"{ssh_user}@{host}:{remote_install_path}")
+    subprocess.check_call(rsync_cmd)
 
     # Upload pubkey.gpg
-    rsync_cmd_pubkey = (
-        f"rsync -avz -e 'ssh -i {ssh_key_path}' {local_pubkey} {ssh_user}@{host}:{remote_debian_path}/pubkey.gpg"
-    )
+    rsync_cmd_pubkey = rsync_argv(ssh_key_path, local_pubkey, f"{ssh_user}@{host}:{remote_debian_path}/pubkey.gpg")
     try:
-        subprocess.check_call(rsync_cmd_pubkey, shell=True)
+        subprocess.check_call(rsync_cmd_pubkey)
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Failed to upload pubkey.gpg: {e}")
         raise
 
     # Set permissions
-    chmod_cmd = f"ssh -i {ssh_key_path} {ssh_user}@{host} 'chmod 644 {remote_install_path} {remote_debian_path}/pubkey.gpg'"
-    subprocess.check_call(chmod_cmd, shell=True)
+    chmod_cmd = ssh_argv(ssh_key_path, ssh_user, host, "chmod", "644", remote_install_path, f"{remote_debian_path}/pubkey.gpg")
+    subprocess.check_call(chmod_cmd)
 
     os.remove(local_install_script)
     print(f"[INFO] install.sh and pubkey.gpg published to {remote_base_path} with permissions 644")
 
 
 def main():
-    new_version = get_new_version(MAJOR_RELEASE_NUMBER)
-    publish_release(new_version)
-    publish_install_script()
+    try:
+        new_version = get_new_version(MAJOR_RELEASE_NUMBER)
+        publish_release(new_version)
+        publish_install_script()
+    finally:
+        close_ssh_master()
 
 
 if __name__ == "__main__":